@@ -0,0 +1,17 @@
+"""
+UNC class-search scraper.
+
+Importing this package is cheap: selenium, bs4, sqlparse, dotenv and supabase
+are only imported (and the Supabase client only created) when a function that
+needs them is called.
+"""
+from .all import (
+    SUBJECT_CODES,
+    get_supabase,
+    main,
+    parse_class_table,
+    run_sql_file,
+    scrape_subject,
+    upload_to_supabase,
+    write_to_jsonl,
+)
@@ -164,44 +164,62 @@
 
 #     print("✅ All subjects complete.")
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup, Tag
-import sqlparse
+# Only stdlib is imported at module level. selenium, bs4, sqlparse, dotenv and
+# supabase are imported inside the functions that need them, so parsers,
+# benchmarks and tests can import this module without credentials or network.
+import argparse
+import functools
+import json
 import os
 import time
-from dotenv import load_dotenv
 from datetime import datetime, timezone
-from supabase import create_client, Client
 
-# ====== 1) Load environment and initialize Supabase client ======
-load_dotenv()
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-assert SUPABASE_KEY and SUPABASE_KEY.startswith("eyJ"), "Service role key not loaded!"
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TERM = "2025 Fall"
+DEFAULT_DRY_RUN_OUTPUT = os.path.join(HERE, "scraped_rows.jsonl")
+SUBJECT_CODES = [
+    "APPL", "AAAD", "ACSM", "ADJU", "AERO", "AFAM", "AFRI", "AHEC", "AHSC", "AIRS", "AMST", "ANA", "ANAT", "ANES", "ANGL", "ANS", "ANSC", "ANTH", "APSM", "ARA", "ARAB", "ARCH", "ARGE", "ARMY", "AROT", "ART", "ARTH", "ARTS", "ASCI", "ASCM", "ASHV", "ASIA", "ASTR", "BACT", "BAE", "BBSP", "BCB", "BCH", "BCHM", "BCS", "BEIJ", "BENG", "BERL", "BIOC", "BIOL", "BIOM", "BIOS", "BIOX", "BMA", "BME", "BMME", "BOE", "BOIC", "BOLO", "BOT", "BOTN", "BRIS", "BSCI", "BUIS", "BULG", "BUSA", "BUSG", "BUSI", "BUSS", "CAPS", "CATA", "CBAM", "CBIO", "CBMC", "CBPH", "CDFS", "CE", "CELT", "CENG", "CEOM", "CERT", "CGL", "CHE", "CHEM", "CHER", "CHIN", "CHIP", "CHPM", "CHSC", "CITZ", "CLAR", "CLAS", "CLIC", "CLIT", "CLSC", "CLSK", "CLST", "CMPL", "COML", "COMM", "COMP", "COPE", "CORE", "COSI", "CPXM", "CRMH", "CS", "CYTO", "CZCH", "DATA", "DATE", "DDDD", "DECO", "DENG", "DENT", "DERM", "DESN", "DHED", "DHYG", "DNDG", "DNEC", "DNED", "DPET", "DPMP", "DPOP", "DPPE", "DRAM", "DTCH", "EAST", "EC", "ECOL", "ECON", "ED", "ED1C", "EDCI", "EDFO", "EDIN", "EDMX", "EDSP", "EDUC", "EDUX", "EE", "EENG", "EGR", "ELAW", "EMES", "ENDO", "ENEC", "ENGL", "ENGM", "ENGR", "ENST", "ENT", "ENUR", "ENVR", "EPID", "ERMD", "EURO", "EXSS", "EXTN", "FARE", "FES", "FMED", "FMME", "FOLK", "FOR", "FORE", "FORS", "FRED", "FREN", "FSCI", "GEN", "GEOG", "GEOL", "GERJ", "GERM", "GHAN", "GLBE", "GLBL", "GN", "GNE", "GNET", "GOTT", "GOVT", "GRAD", "GREK", "GSA", "GSLL", "HAD", "HADA", "HADM", "HAUS", "HBEH", "HBHE", "HCTS", "HDL", "HE", "HEBR", "HECO", "HEED", "HIND", "HIST", "HLTH", "HMSC", "HMST", "HMTS", "HNRS", "HNUR", "HOME", "HORT", "HPAA", "HPM", "HSCI", "HST", "HUNG", "HUSA", "HYGI", "IBMS", "ICMU", "ICRS", "ICSR", "IDST", "IENG", "IEP", "IHMS", "IIOC", "IMMU", "INDC", "INDO", "INDR", "INFO", "INLS", "INTI", "INTS", "ISO", "ISRA", "ITAL", "JAP", "JAPN", "JOMC", "JOUR", "JWST", "KANS", "KFM", "KOR", "LAQ", "LAR", "LARS", "LATN", "LAW", "LEED", "LFIT", "LGLA", "LIBS", "LIMA", "LING", "LOND", "LSA", "LSEC", "LSRA", "LSSM", "LTAM", "LVE", "LW", "LYON", "MA", "MAC", "MACD", "MACF", "MAE", "MAHP", "MANC", "MANS", "MASC", "MAT", "MATE", "MATH", "MAYA", "MBA", "MBIO", "MCHL", "MCRO", "MDPH", "MDSP", "MEDC", "MEDF", "MEDI", "MEDT", "MEEN", "MEJO", "MENG", "MENH", "MESE", "METR", "MEXI", "MHCH", "MIC", "MICR", "MILS", "MISC", "MNDG", "MNGT", "MODC", "MONT", "MOPH", "MOPL", "MPED", "MS", "MSBS", "MSCI", "MSMS", "MTEC", "MTSC", "MUSC", "MXCL", "MYCO", "NANZ", "NAVS", "NBIO", "NDSS", "NE", "NENG", "NEUR", "NEUS", "NORW", "NSCI", "NSP", "NT", "NURS", "NUSJ", "NUTR", "OBGN", "OBIO", "OCBM", "OCCT", "OCEN", "OCSC", "ODTP", "OMED", "OMSU", "OPER", "OPHT", "OR", "ORAD", "ORDI", "ORLN", "ORPA", "ORSA", "ORSU", "ORTH", "ORTS", "OTOL", "P-LI", "PACE", "PADM", "PADS", "PALP", "PARA", "PASC", "PATH", "PATY", "PEDI", "PEDO", "PEDS", "PERI", "PERS", "PERU", "PEW", "PHAD", "PHAR", "PHCG", "PHCH", "PHCO", "PHCY", "PHED", "PHIL", "PHPR", "PHRS", "PHS", "PHTH", "PHYA", "PHYE", "PHYI", "PHYS", "PHYT", "PHYY", "PLAN", "PLCY", "PLNT", "PLSH", "PLTM", "PMED", "PO", "POLI", "POLT", "PORT", "PP", "PPES", "PPOL", "PPS", "PREV", "PROD", "PROS", "PRSN", "PS", "PSNU", "PSY", "PSYC", "PSYI", "PSYS", "PSYY", "PUBA", "PUBH", "PUBP", "PUPA", "PVME", "PWAD", "PYSI", "QHCH", "RADG", "RADI", "RADY", "RECR", "REL", "RELI", "REST", "RFIX", "RHAB", "RLGE", "ROMA", "ROML", "RPSY", "RTVM", "RUES", "RUMA", "RUSS", "SADM", "SANS", "SCLL", "SECR", "SERB", "SEVI", "SIEN", "SLAV", "SNVR", "SOC", "SOCI", "SOCM", "SOIL", "SOMP", "SOWO", "SPAN", "SPCH", "SPCY", "SPHG", "SPHS", "SSAP", "SSC", "SSCI", "ST", "STA", "STAN", "STAT", "STOR", "SUOP", "SURG", "SURS", "SURY", "SUSS", "SWAH", "SWED", "TAML", "TEXT", "THER", "TOXC", "TOXI", "TREQ", "TRXN", "TUBI", "TURK", "UBDS", "UKRN", "UNI", "UNIV", "URES", "VET", "VIET", "WGST", "WMST", "WOLL", "WOLO", "YIDI", "YORU", "ZOOL"
+]
+
+# ====== 1) Lazily load environment and initialize Supabase client ======
+_supabase = None
+
+def get_supabase():
+    """
+    Returns the shared Supabase client, creating it on first use.
+    """
+    global _supabase
+    if _supabase is None:
+        from dotenv import load_dotenv
+        from supabase import create_client
+
+        load_dotenv()
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        assert supabase_key and supabase_key.startswith("eyJ"), "Service role key not loaded!"
+        _supabase = create_client(supabase_url, supabase_key)
+    return _supabase
 
 def run_sql_file(path: str):
     """
     Splits SQL file into statements and runs each via run_sql RPC.
     """
+    import sqlparse
+
     with open(path, 'r') as f:
         raw_sql = f.read()
+    client = get_supabase()
     for statement in sqlparse.split(raw_sql):
         stmt = statement.strip()
         if not stmt:
             continue
-        supabase.rpc('run_sql', {'sql': stmt}).execute()
+        client.rpc('run_sql', {'sql': stmt}).execute()
 
 
-# ====== 2) Scraper Function ======
-def scrape_subject(term: str, subject_code: str):
+# ====== 2) Scraper Functions ======
+def parse_class_table(page_source: str):
     """
-    Scrapes UNC's class-search for a given term + subject_code.
+    Parses the class-search results page HTML.
     Returns a list of dicts:
       {
         "catalog_number": <text>,
@@ -210,62 +228,18 @@ def scrape_subject(term: str, subject_code: str):
         "scraped_at":     <ISO timestamp>
       }
     """
-    chrome_options = Options()
-    # Point to the Chromium binary installed in GitHub Actions
-    chrome_options.binary_location = "/usr/bin/chromium-browser"
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-
-    # Explicitly point to the installed chromedriver
-    driver = webdriver.Chrome(
-        service=Service("/usr/bin/chromedriver"),
-        options=chrome_options
-    )
-    driver.set_page_load_timeout(30)
-    driver.get("https://reports.unc.edu/class-search/")
-
-    # 1) Input Term
-    term_input = WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.NAME, "term"))
-    )
-    term_input.clear()
-    term_input.send_keys(term)
-
-    # 2) Input Subject Code
-    subject_input = driver.find_element(By.NAME, "subject")
-    subject_input.clear()
-    subject_input.send_keys(subject_code)
-
-    # 3) Click Search
-    search_button = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.ID, "filter-submit"))
-    )
-    search_button.click()
-
-    # 4) Wait for <table> to appear
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.XPATH, "//table"))
-    )
-
-    # 5) Scroll several times to force all rows to load
-    for _ in range(5):
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1.5)
+    from bs4 import BeautifulSoup, Tag
 
-    # 6) Parse HTML with BeautifulSoup
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    soup = BeautifulSoup(page_source, "html.parser")
     table = soup.find("table")
     if table is None:
-        driver.quit()
         return []  # No results for this subject
 
-    # 7) Count header columns (should be 14)
+    # Count header columns (should be 14)
     header_cells = [th.get_text(strip=True) for th in table.find("tr").find_all("th")]
     expected_columns = len(header_cells)
 
-    # 8) Fixed indexes for needed columns
+    # Fixed indexes for needed columns
     idx_catalog_number = 1
     idx_schedule       = 9
     idx_room           = 10
@@ -273,7 +247,7 @@ def scrape_subject(term: str, subject_code: str):
     rows = []
     last_catalog_number = ""  # Carry-forward variable
 
-    # 9) Iterate over every data <tr> (skip header row)
+    # Iterate over every data <tr> (skip header row)
     for tr in table.find_all("tr")[1:]:
         tds = tr.find_all("td")
 
@@ -286,14 +260,14 @@ def scrape_subject(term: str, subject_code: str):
         if len(tds) != expected_columns:
             continue
 
-        # 10) Carry forward catalog number
+        # c) Carry forward catalog number
         raw_catnum = ""
         if isinstance(tds[idx_catalog_number], Tag):
             raw_catnum = tds[idx_catalog_number].get_text(strip=True)
         if raw_catnum:
             last_catalog_number = raw_catnum
 
-        # 11) Extract schedule & room
+        # d) Extract schedule & room
         schedule_text = tds[idx_schedule].get_text(strip=True) if isinstance(tds[idx_schedule], Tag) else ""
         room_text     = tds[idx_room].get_text(strip=True)     if isinstance(tds[idx_room], Tag)     else ""
 
@@ -304,31 +278,133 @@ def scrape_subject(term: str, subject_code: str):
             "scraped_at":     datetime.now(timezone.utc).isoformat()
         })
 
-    driver.quit()
     return rows
 
-# ====== 3) Upload to Supabase ======
+def scrape_subject(term: str, subject_code: str):
+    """
+    Scrapes UNC's class-search for a given term + subject_code.
+    Returns the rows produced by parse_class_table().
+    """
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    chrome_options = Options()
+    # Point to the Chromium binary installed in GitHub Actions
+    chrome_options.binary_location = "/usr/bin/chromium-browser"
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+
+    # Explicitly point to the installed chromedriver
+    driver = webdriver.Chrome(
+        service=Service("/usr/bin/chromedriver"),
+        options=chrome_options
+    )
+    try:
+        driver.set_page_load_timeout(30)
+        driver.get("https://reports.unc.edu/class-search/")
+
+        # 1) Input Term
+        term_input = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.NAME, "term"))
+        )
+        term_input.clear()
+        term_input.send_keys(term)
+
+        # 2) Input Subject Code
+        subject_input = driver.find_element(By.NAME, "subject")
+        subject_input.clear()
+        subject_input.send_keys(subject_code)
+
+        # 3) Click Search
+        search_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "filter-submit"))
+        )
+        search_button.click()
+
+        # 4) Wait for <table> to appear
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, "//table"))
+        )
+
+        # 5) Scroll several times to force all rows to load
+        for _ in range(5):
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(1.5)
+
+        page_source = driver.page_source
+    finally:
+        driver.quit()
+
+    # 6) Parse HTML with BeautifulSoup
+    return parse_class_table(page_source)
+
+
+# ====== 3) Sinks ======
 def upload_to_supabase(rows):
     """
     Insert each row into Supabase table “classroom_courses”.
     """
+    client = get_supabase()
     for row in rows:
-        supabase.table("classroom_courses").insert(row).execute()
+        client.table("classroom_courses").insert(row).execute()
+
+def write_to_jsonl(rows, path: str):
+    """
+    Append each row as one JSON line to a local file (used by --dry-run).
+    """
+    with open(path, 'a', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+# ====== 4) CLI ======
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m scraper",
+        description="Scrape UNC class-search and upload room schedules to Supabase."
+    )
+    parser.add_argument("--term", default=DEFAULT_TERM,
+                        help=f"term to scrape (default: {DEFAULT_TERM!r})")
+    parser.add_argument("--subjects", nargs="+", metavar="CODE",
+                        help="subject codes to scrape (default: every known subject)")
+    parser.add_argument("--dry-run", "--no-upload", dest="dry_run", action="store_true",
+                        help="skip Supabase entirely and write rows to a local JSONL file")
+    parser.add_argument("--output", default=DEFAULT_DRY_RUN_OUTPUT,
+                        help="JSONL file used by --dry-run (default: scraper/scraped_rows.jsonl)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    subject_codes = args.subjects or SUBJECT_CODES
+
+    if args.dry_run:
+        # Start from an empty file, mirroring the table clear below
+        open(args.output, 'w', encoding='utf-8').close()
+        sink = functools.partial(write_to_jsonl, path=args.output)
+        print(f"Dry run: writing rows to {args.output}")
+    else:
+        sink = upload_to_supabase
+        run_sql_file(os.path.join(HERE, 'clear_appended_tables.sql'))
 
-# ====== 4) Main Execution Block ======
-if __name__ == "__main__":
-    term = "2025 Fall"
-    subject_codes = [
-       "APPL", "AAAD", "ACSM", "ADJU", "AERO", "AFAM", "AFRI", "AHEC", "AHSC", "AIRS", "AMST", "ANA", "ANAT", "ANES", "ANGL", "ANS", "ANSC", "ANTH", "APSM", "ARA", "ARAB", "ARCH", "ARGE", "ARMY", "AROT", "ART", "ARTH", "ARTS", "ASCI", "ASCM", "ASHV", "ASIA", "ASTR", "BACT", "BAE", "BBSP", "BCB", "BCH", "BCHM", "BCS", "BEIJ", "BENG", "BERL", "BIOC", "BIOL", "BIOM", "BIOS", "BIOX", "BMA", "BME", "BMME", "BOE", "BOIC", "BOLO", "BOT", "BOTN", "BRIS", "BSCI", "BUIS", "BULG", "BUSA", "BUSG", "BUSI", "BUSS", "CAPS", "CATA", "CBAM", "CBIO", "CBMC", "CBPH", "CDFS", "CE", "CELT", "CENG", "CEOM", "CERT", "CGL", "CHE", "CHEM", "CHER", "CHIN", "CHIP", "CHPM", "CHSC", "CITZ", "CLAR", "CLAS", "CLIC", "CLIT", "CLSC", "CLSK", "CLST", "CMPL", "COML", "COMM", "COMP", "COPE", "CORE", "COSI", "CPXM", "CRMH", "CS", "CYTO", "CZCH", "DATA", "DATE", "DDDD", "DECO", "DENG", "DENT", "DERM", "DESN", "DHED", "DHYG", "DNDG", "DNEC", "DNED", "DPET", "DPMP", "DPOP", "DPPE", "DRAM", "DTCH", "EAST", "EC", "ECOL", "ECON", "ED", "ED1C", "EDCI", "EDFO", "EDIN", "EDMX", "EDSP", "EDUC", "EDUX", "EE", "EENG", "EGR", "ELAW", "EMES", "ENDO", "ENEC", "ENGL", "ENGM", "ENGR", "ENST", "ENT", "ENUR", "ENVR", "EPID", "ERMD", "EURO", "EXSS", "EXTN", "FARE", "FES", "FMED", "FMME", "FOLK", "FOR", "FORE", "FORS", "FRED", "FREN", "FSCI", "GEN", "GEOG", "GEOL", "GERJ", "GERM", "GHAN", "GLBE", "GLBL", "GN", "GNE", "GNET", "GOTT", "GOVT", "GRAD", "GREK", "GSA", "GSLL", "HAD", "HADA", "HADM", "HAUS", "HBEH", "HBHE", "HCTS", "HDL", "HE", "HEBR", "HECO", "HEED", "HIND", "HIST", "HLTH", "HMSC", "HMST", "HMTS", "HNRS", "HNUR", "HOME", "HORT", "HPAA", "HPM", "HSCI", "HST", "HUNG", "HUSA", "HYGI", "IBMS", "ICMU", "ICRS", "ICSR", "IDST", "IENG", "IEP", "IHMS", "IIOC", "IMMU", "INDC", "INDO", "INDR", "INFO", "INLS", "INTI", "INTS", "ISO", "ISRA", "ITAL", "JAP", "JAPN", "JOMC", "JOUR", "JWST", "KANS", "KFM", "KOR", "LAQ", "LAR", "LARS", "LATN", "LAW", "LEED", "LFIT", "LGLA", "LIBS", "LIMA", "LING", "LOND", "LSA", "LSEC", "LSRA", "LSSM", "LTAM", "LVE", "LW", "LYON", "MA", "MAC", "MACD", "MACF", "MAE", "MAHP", "MANC", "MANS", "MASC", "MAT", "MATE", "MATH", "MAYA", "MBA", "MBIO", "MCHL", "MCRO", "MDPH", "MDSP", "MEDC", "MEDF", "MEDI", "MEDT", "MEEN", "MEJO", "MENG", "MENH", "MESE", "METR", "MEXI", "MHCH", "MIC", "MICR", "MILS", "MISC", "MNDG", "MNGT", "MODC", "MONT", "MOPH", "MOPL", "MPED", "MS", "MSBS", "MSCI", "MSMS", "MTEC", "MTSC", "MUSC", "MXCL", "MYCO", "NANZ", "NAVS", "NBIO", "NDSS", "NE", "NENG", "NEUR", "NEUS", "NORW", "NSCI", "NSP", "NT", "NURS", "NUSJ", "NUTR", "OBGN", "OBIO", "OCBM", "OCCT", "OCEN", "OCSC", "ODTP", "OMED", "OMSU", "OPER", "OPHT", "OR", "ORAD", "ORDI", "ORLN", "ORPA", "ORSA", "ORSU", "ORTH", "ORTS", "OTOL", "P-LI", "PACE", "PADM", "PADS", "PALP", "PARA", "PASC", "PATH", "PATY", "PEDI", "PEDO", "PEDS", "PERI", "PERS", "PERU", "PEW", "PHAD", "PHAR", "PHCG", "PHCH", "PHCO", "PHCY", "PHED", "PHIL", "PHPR", "PHRS", "PHS", "PHTH", "PHYA", "PHYE", "PHYI", "PHYS", "PHYT", "PHYY", "PLAN", "PLCY", "PLNT", "PLSH", "PLTM", "PMED", "PO", "POLI", "POLT", "PORT", "PP", "PPES", "PPOL", "PPS", "PREV", "PROD", "PROS", "PRSN", "PS", "PSNU", "PSY", "PSYC", "PSYI", "PSYS", "PSYY", "PUBA", "PUBH", "PUBP", "PUPA", "PVME", "PWAD", "PYSI", "QHCH", "RADG", "RADI", "RADY", "RECR", "REL", "RELI", "REST", "RFIX", "RHAB", "RLGE", "ROMA", "ROML", "RPSY", "RTVM", "RUES", "RUMA", "RUSS", "SADM", "SANS", "SCLL", "SECR", "SERB", "SEVI", "SIEN", "SLAV", "SNVR", "SOC", "SOCI", "SOCM", "SOIL", "SOMP", "SOWO", "SPAN", "SPCH", "SPCY", "SPHG", "SPHS", "SSAP", "SSC", "SSCI", "ST", "STA", "STAN", "STAT", "STOR", "SUOP", "SURG", "SURS", "SURY", "SUSS", "SWAH", "SWED", "TAML", "TEXT", "THER", "TOXC", "TOXI", "TREQ", "TRXN", "TUBI", "TURK", "UBDS", "UKRN", "UNI", "UNIV", "URES", "VET", "VIET", "WGST", "WMST", "WOLL", "WOLO", "YIDI", "YORU", "ZOOL"
-    ]
-    run_sql_file('clear_appended_tables.sql')
     for subj in subject_codes:
-        print(f"Scraping {subj} for {term}…")
+        print(f"Scraping {subj} for {args.term}…")
         try:
-            result_rows = scrape_subject(term, subj)
+            result_rows = scrape_subject(args.term, subj)
             print(f"  → Found {len(result_rows)} rows.")
-            upload_to_supabase(result_rows)
+            sink(result_rows)
         except Exception as exc:
             print(f"  ✖ Failed on {subj}: {exc}")
-    run_sql_file('update_free_slots.sql')
+
+    if not args.dry_run:
+        run_sql_file(os.path.join(HERE, 'update_free_slots.sql'))
     print("✅ All subjects complete.")
+
+
+if __name__ == "__main__":
+    main()
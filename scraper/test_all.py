@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["selenium", "bs4", "supabase", "dotenv", "sqlparse"]
+
+
+def test_import_does_not_load_heavy_dependencies():
+    # Run in a fresh interpreter so modules imported by other tests don't leak in
+    code = (
+        "import sys, scraper; "
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def _row(*cells):
+    return "<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>"
+
+
+def test_parse_class_table_pads_and_carries_catalog_number():
+    pytest.importorskip("bs4")
+    from scraper import parse_class_table
+
+    header = "<tr>" + "".join(f"<th>h{i}</th>" for i in range(14)) + "</tr>"
+    full = _row("COMP", "110", *[""] * 7, "MWF 9:05 AM", "SITT 014", "", "", "")
+    # Continuation rows omit leading cells; the parser pads them on the left
+    short = _row(*[""] * 6, "TTH 11:00 AM", "GRAV 001", "", "", "")
+    html = f"<table>{header}{full}{short}</table>"
+
+    rows = parse_class_table(html)
+
+    assert [(r["catalog_number"], r["schedule"], r["room"]) for r in rows] == [
+        ("110", "MWF 9:05 AM", "SITT 014"),
+        ("110", "TTH 11:00 AM", "GRAV 001"),
+    ]
+    assert all(r["scraped_at"] for r in rows)
+
+
+def test_parse_class_table_without_table_returns_empty():
+    pytest.importorskip("bs4")
+    from scraper import parse_class_table
+
+    assert parse_class_table("<html><body>No results</body></html>") == []